@@ -1,4 +1,6 @@
+from src.config import configure_logging
 from src.config.server import app
 
 if __name__ == "__main__":
+    configure_logging()
     app.run(transport="sse")
@@ -5,7 +5,7 @@ This module provides a centralized configuration system that:
 1. Loads environment variables (from .env files)
 2. Loads structured config data from YAML files
 3. Combines both sources into a validated configuration object
-4. Initializes a logging system
+4. Provides a logging system, configured by the entry point
 
 Usage:
     from src.config import settings
@@ -13,8 +13,9 @@ Usage:
     # Access configuration values
     api_url = settings.api.url
 
-    # Access logger
-    from src.config import logger
+    # Configure logging once at startup, then use the logger
+    from src.config import configure_logging, logger
+    configure_logging()
     logger.info("Application started")
 """
 
@@ -15,6 +15,18 @@ from src.config.settings import settings
 # Create logger
 logger = logging.getLogger("mcp_server")
 
+# Mapping of log level names to logging levels
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Last configuration applied by configure_logging, to make it idempotent
+_current_config: tuple | None = None
+
 
 def get_log_level(level_name: str) -> int:
     """
@@ -25,8 +37,11 @@ def get_log_level(level_name: str) -> int:
 
     Returns:
         Logging level as an integer
+
+    Raises:
+        KeyError: If the level name is unknown
     """
-    return getattr(logging, level_name.upper())
+    return LOG_LEVELS[level_name.upper()]
 
 
 def configure_logging(
@@ -51,6 +66,8 @@ def configure_logging(
     Returns:
         Configured logger
     """
+    global _current_config
+
     # Use provided values or fall back to settings
     level = level or settings.logging.level
     format_str = format_str or settings.logging.format
@@ -61,6 +78,18 @@ def configure_logging(
     file_max_bytes = file_max_bytes or settings.logging.file_max_bytes
     file_backup_count = file_backup_count or settings.logging.file_backup_count
 
+    # Nothing to do if the same configuration is already in place
+    config = (
+        level,
+        format_str,
+        file_enabled,
+        file_path,
+        file_max_bytes,
+        file_backup_count,
+    )
+    if config == _current_config:
+        return logger
+
     # Convert level name to logging level
     log_level = get_log_level(level)
 
@@ -87,12 +116,13 @@ def configure_logging(
         log_file = Path(file_path)
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create rotating file handler
+        # Create rotating file handler, opening the file on the first record
         file_handler = RotatingFileHandler(
             file_path,
             maxBytes=file_max_bytes,
             backupCount=file_backup_count,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
@@ -101,8 +131,5 @@ def configure_logging(
     # Configure our logger
     logger.setLevel(log_level)
 
+    _current_config = config
     return logger
-
-
-# Configure logging when the module is imported
-configure_logging()
@@ -1,74 +1,85 @@
 """
 Settings module for the MCP Server.
 
-This module defines the configuration structure using Pydantic models
-and loads configuration from environment variables and YAML files.
+This module defines the configuration structure using frozen dataclasses for
+the environment settings and Pydantic models for the YAML configuration, and
+loads configuration from environment variables and YAML files.
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
-load_dotenv()
+
+@cache
+def _load_env() -> bool:
+    """Load the .env file once per process."""
+    return load_dotenv()
+
+
+_load_env()
 
 BASE_DIR = Path(__file__).parent.parent.parent
 
 
-class LegifranceSettings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LegifranceSettings:
     """Settings for the Legifrance API."""
 
-    api_url: str = Field(
-        default="https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app",
-        description="URL of the Legifrance API",
-    )
-    client_id: str = Field(default="", description="Client ID for the Legifrance API")
-    client_secret: str = Field(
-        default="", description="Client secret for the Legifrance API"
-    )
-    token_url: str = Field(
-        default="https://sandbox-oauth.gouv.fr/api/oauth/token",
-        description="Token URL for the Legifrance API",
-    )
+    # URL of the Legifrance API
+    api_url: str = "https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app"
+    # Client ID for the Legifrance API
+    client_id: str = ""
+    # Client secret for the Legifrance API
+    client_secret: str = ""
+    # Token URL for the Legifrance API
+    token_url: str = "https://sandbox-oauth.gouv.fr/api/oauth/token"
 
 
-class ServerSettings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ServerSettings:
     """Settings for the MCP Server."""
 
-    host: str = Field(default="localhost", description="Host for the MCP Server")
-    port: int = Field(default=8080, description="Port for the MCP Server")
+    # Host for the MCP Server
+    host: str = "localhost"
+    # Port for the MCP Server
+    port: int = 8080
 
 
-class ApiSettings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ApiSettings:
     """Settings for the development API."""
 
-    key: str = Field(default="", description="API key for the development API")
-    url: str = Field(default="", description="URL for the development API")
+    # API key for the development API
+    key: str = ""
+    # URL for the development API
+    url: str = ""
 
 
-class LoggingSettings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LoggingSettings:
     """Settings for the logging system."""
 
-    level: str = Field(default="INFO", description="Logging level")
-    format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Logging format",
-    )
-    file_enabled: bool = Field(default=False, description="Whether to log to a file")
-    file_path: str | None = Field(default=None, description="Path to the log file")
-    file_max_bytes: int = Field(
-        default=10485760,  # 10 MB
-        description="Maximum size of the log file before rotation",
-    )
-    file_backup_count: int = Field(
-        default=5, description="Number of backup log files to keep"
-    )
-
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
+    # Logging level
+    level: str = "INFO"
+    # Logging format
+    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # Whether to log to a file
+    file_enabled: bool = False
+    # Path to the log file
+    file_path: str | None = None
+    # Maximum size of the log file before rotation
+    file_max_bytes: int = 10485760  # 10 MB
+    # Number of backup log files to keep
+    file_backup_count: int = 5
+
+    @staticmethod
+    def validate_level(v: str) -> str:
         """Validate that the logging level is valid."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if v.upper() not in valid_levels:
@@ -114,13 +125,14 @@ class YamlConfig(BaseModel):
     prompts: dict[str, PromptConfig]
 
 
-class Settings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Settings:
     """Main settings class that combines all configuration sources."""
 
-    legifrance: LegifranceSettings = Field(default_factory=LegifranceSettings)
-    server: ServerSettings = Field(default_factory=ServerSettings)
-    api: ApiSettings = Field(default_factory=ApiSettings)
-    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    legifrance: LegifranceSettings = field(default_factory=LegifranceSettings)
+    server: ServerSettings = field(default_factory=ServerSettings)
+    api: ApiSettings = field(default_factory=ApiSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
     yaml_config: YamlConfig | None = None
 
 
@@ -136,34 +148,39 @@ def create_settings() -> Settings:
     Returns:
         Settings object with the combined configuration
     """
-    # Create settings with environment variables
+    _load_env()
+    env = os.environ
+    legifrance_defaults = LegifranceSettings()
+    server_defaults = ServerSettings()
+    logging_defaults = LoggingSettings()
+
     settings = Settings(
         legifrance=LegifranceSettings(
-            api_url=os.getenv("LEGIFRANCE_API_URL", LegifranceSettings().api_url),
-            client_id=os.getenv("LEGIFRANCE_CLIENT_ID", ""),
-            client_secret=os.getenv("LEGIFRANCE_CLIENT_SECRET", ""),
-            token_url=os.getenv("LEGIFRANCE_TOKEN_URL", LegifranceSettings().token_url),
+            api_url=env.get("LEGIFRANCE_API_URL", legifrance_defaults.api_url),
+            client_id=env.get("LEGIFRANCE_CLIENT_ID", ""),
+            client_secret=env.get("LEGIFRANCE_CLIENT_SECRET", ""),
+            token_url=env.get("LEGIFRANCE_TOKEN_URL", legifrance_defaults.token_url),
         ),
         server=ServerSettings(
-            host=os.getenv("MCP_SERVER_HOST", ServerSettings().host),
-            port=int(os.getenv("MCP_SERVER_PORT", str(ServerSettings().port))),
+            host=env.get("MCP_SERVER_HOST", server_defaults.host),
+            port=int(env.get("MCP_SERVER_PORT", server_defaults.port)),
         ),
         api=ApiSettings(
-            key=os.getenv("DEV_API_KEY", "development_key"),
-            url=os.getenv("DEV_API_URL", "development_key"),
+            key=env.get("DEV_API_KEY", "development_key"),
+            url=env.get("DEV_API_URL", "development_key"),
         ),
         logging=LoggingSettings(
-            level=os.getenv("LOG_LEVEL", LoggingSettings().level),
-            format=os.getenv("LOG_FORMAT", LoggingSettings().format),
-            file_enabled=os.getenv("LOG_FILE_ENABLED", "").lower() == "true",
-            file_path=os.getenv("LOG_FILE_PATH"),
+            level=LoggingSettings.validate_level(
+                env.get("LOG_LEVEL", logging_defaults.level)
+            ),
+            format=env.get("LOG_FORMAT", logging_defaults.format),
+            file_enabled=env.get("LOG_FILE_ENABLED", "").lower() == "true",
+            file_path=env.get("LOG_FILE_PATH"),
             file_max_bytes=int(
-                os.getenv("LOG_FILE_MAX_BYTES", str(LoggingSettings().file_max_bytes))
+                env.get("LOG_FILE_MAX_BYTES", logging_defaults.file_max_bytes)
             ),
             file_backup_count=int(
-                os.getenv(
-                    "LOG_FILE_BACKUP_COUNT", str(LoggingSettings().file_backup_count)
-                )
+                env.get("LOG_FILE_BACKUP_COUNT", logging_defaults.file_backup_count)
             ),
         ),
     )
@@ -5,14 +5,58 @@ This module provides functionality for managing and rendering prompt templates
 for LLM interactions.
 """
 
-from src.config import settings
+import re
+from functools import cache
+
 from src.config.server import app
 from src.utils.utils import load_prompt_templates
 
-tools_config = settings.yaml_config
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_]\w*)\}")
+
+
+@cache
+def compile_prompt(prompt_name: str) -> tuple[tuple[str, tuple], ...]:
+    """
+    Précompile les messages d'un prompt pour un rendu rapide.
+
+    Chaque message devient un couple (rôle, éléments de contenu) où les textes
+    des messages utilisateur sont marqués comme gabarits à formater.
+
+    Args:
+        prompt_name (str): Nom du prompt à compiler
+
+    Returns:
+        tuple: Messages compilés sous la forme ((rôle, ((élément, gabarit), ...)), ...)
+    """
+    template = load_prompt_templates()[prompt_name]
+    return tuple(
+        (
+            message["role"],
+            tuple(
+                (item, message["role"] == "user" and item["type"] == "text")
+                for item in message["content"]
+            ),
+        )
+        for message in template["messages"]
+    )
+
 
+def render_template(text: str, variables: dict) -> str:
+    """
+    Remplace les variables {nom} d'un texte en une seule passe.
 
-PROMPT_TEMPLATES = load_prompt_templates()
+    Les variables absentes de `variables` sont laissées telles quelles.
+
+    Args:
+        text (str): Texte du gabarit
+        variables (dict): Valeurs des variables
+
+    Returns:
+        str: Texte rendu
+    """
+    return _PLACEHOLDER_RE.sub(
+        lambda match: str(variables.get(match.group(1), match.group(0))), text
+    )
 
 
 @app.prompt(name="agent_juridique_expert")
@@ -27,19 +71,25 @@ async def get_prompt(prompt_name: str, inputs: dict) -> dict:
     Returns:
         Dict: Structure du prompt
     """
-    if prompt_name not in PROMPT_TEMPLATES:
+    template = load_prompt_templates().get(prompt_name)
+    if template is None:
         raise ValueError(f"Prompt inconnu: {prompt_name}")
 
-    template = PROMPT_TEMPLATES[prompt_name]
-
     if prompt_name != "agent_juridique_expert":
         return template
 
-    question = inputs.get("question", "")
-    for message in template["messages"]:
-        if message["role"] != "user":
-            continue
-        for content_item in message["content"]:
-            if content_item["type"] == "text":
-                content_item["text"] = content_item["text"].format(question=question)
-    return template
+    variables = {"question": inputs.get("question", "")}
+    return {
+        "messages": [
+            {
+                "role": role,
+                "content": [
+                    {**item, "text": render_template(item["text"], variables)}
+                    if is_template
+                    else dict(item)
+                    for item, is_template in content
+                ],
+            }
+            for role, content in compile_prompt(prompt_name)
+        ]
+    }
@@ -1,10 +1,19 @@
+import asyncio
+import atexit
 import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from typing import Any, TypeVar
 
 import httpx
+import orjson
 from pydantic import BaseModel
-from tenacity import before_sleep_log, retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
 
@@ -12,6 +21,110 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Tokens expiring within this many seconds are refreshed in the background
+TOKEN_REFRESH_SKEW = 120.0
+
+# Headers sent to the Legifrance API
+API_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+# Headers sent to the OAuth token endpoint
+TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Connection pool shared by requests to the Legifrance hosts
+HTTP_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Successful responses are reused for identical requests within this delay
+RESPONSE_CACHE_TTL = 300.0
+RESPONSE_CACHE_SIZE = 512
+
+# Maximum number of endpoint URLs remembered by a client
+URL_CACHE_SIZE = 128
+
+
+# Number of attempts for requests failing with a transient error
+MAX_ATTEMPTS = 3
+
+
+def _is_retryable(e: httpx.HTTPError) -> bool:
+    """Return whether an HTTP error is transient (connection error or 5xx)."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, httpx.RequestError)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the exponential backoff delay, with jitter, after an attempt."""
+    return min(10.0, 0.5 * 2**attempt) + random.uniform(0, 0.25)
+
+
+def _send_with_retry(send: Callable[[], httpx.Response]) -> httpx.Response:
+    """
+    Send a request and check its status, retrying transient failures.
+
+    Args:
+        send: Callable performing the request
+
+    Returns:
+        The successful response
+
+    Raises:
+        httpx.HTTPError: If the request fails for good
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            response = send()
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if attempt == MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Retrying in {delay:.2f} seconds as it raised {e!r}")
+            time.sleep(delay)
+
+
+async def _send_with_retry_async(
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Async version: Send a request and check its status, retrying transient failures.
+
+    Args:
+        send: Callable returning the request coroutine
+
+    Returns:
+        The successful response
+
+    Raises:
+        httpx.HTTPError: If the request fails for good
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            response = await send()
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if attempt == MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Retrying in {delay:.2f} seconds as it raised {e!r}")
+            await asyncio.sleep(delay)
+
+
+def _noop() -> None:
+    """Do nothing; replaces the token checks of clients using a static token."""
+
+
+async def _async_noop() -> None:
+    """Async version: Do nothing."""
+
 
 class APIError(Exception):
     """Base class for API-related errors."""
@@ -51,6 +164,63 @@ class TokenInfo(BaseModel):
 
     access_token: str
     expires_at: datetime | None = None
+    # time.monotonic() deadline used for expiry checks
+    expires_at_mono: float | None = None
+
+
+class BearerAuth(httpx.Auth):
+    """
+    httpx authentication flow attaching the current bearer token.
+
+    When bound to an API client, the flow makes sure the token is valid before
+    each request and, if the server still answers 401, renews it and sends the
+    request once more.
+    """
+
+    def __init__(self, client: "LegifranceApiClient | None" = None) -> None:
+        self._header: str | None = None
+        self._client = client
+
+    @property
+    def header(self) -> str | None:
+        """Return the Authorization header currently sent."""
+        return self._header
+
+    def set_token(self, token: str) -> None:
+        """Set the access token sent with subsequent requests."""
+        self._header = f"Bearer {token}"
+
+    def _authorize(self, request: httpx.Request) -> httpx.Request:
+        """Add the Authorization header to the outgoing request."""
+        if self._header is not None:
+            request.headers["Authorization"] = self._header
+        return request
+
+    def sync_auth_flow(self, request: httpx.Request):
+        """Authenticate a request sent by the synchronous client."""
+        if self._client is not None:
+            self._client._ensure_token()
+        response = yield self._authorize(request)
+        if (
+            response.status_code == 401
+            and self._client is not None
+            and self._client._renew_token(request.headers.get("Authorization"))
+        ):
+            yield self._authorize(request)
+
+    async def async_auth_flow(self, request: httpx.Request):
+        """Authenticate a request sent by the asynchronous client."""
+        if self._client is not None:
+            await self._client._ensure_token_async()
+        response = yield self._authorize(request)
+        if (
+            response.status_code == 401
+            and self._client is not None
+            and await self._client._renew_token_async(
+                request.headers.get("Authorization")
+            )
+        ):
+            yield self._authorize(request)
 
 
 class LegifranceApiClient:
@@ -78,33 +248,53 @@ class LegifranceApiClient:
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        self._url_cache: dict[str, str] = {}
 
+        # HTTP/2 and a larger keep-alive pool amortize TLS handshakes. No
+        # explicit transport, so that HTTP(S)_PROXY/NO_PROXY are still honoured
+        self._auth = BearerAuth(self)
         self.client = httpx.Client(
-            headers=self._headers,
+            headers=API_HEADERS,
+            auth=self._auth,
+            timeout=timeout,
+            http2=True,
+            limits=HTTP_LIMITS,
+        )
+        # Created once and kept for the lifetime of the client so its
+        # connection pool is never silently rebuilt
+        self._async_client = httpx.AsyncClient(
+            headers=API_HEADERS,
+            auth=self._auth,
             timeout=timeout,
+            http2=True,
+            limits=HTTP_LIMITS,
         )
 
-        self._async_client = None
+        self._token_client = None
+        self._token_async_client = None
         self._client_id = client_id
         self._client_secret = client_secret
         self._token_url = token_url
+        # Serialize token refreshes so concurrent callers share a single one
+        self._token_lock = threading.Lock()
+        self._token_async_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
 
+        self.token_info: TokenInfo | None = None
         if token:
             self.token_info = TokenInfo(access_token=token)
-        elif all([client_id, client_secret, token_url]):
-            self.token_info = self._get_access_token()
-        else:
+            self._update_auth_header()
+            if not token_url:
+                # A static token is never refreshed: skip the per-request check
+                self._ensure_token = _noop
+                self._ensure_token_async = _async_noop
+        elif not (client_id and client_secret and token_url):
             raise ValueError(
                 "Either a token must be provided or client credentials and "
                 "token_url must be specified."
             )
-
-        self._headers["Authorization"] = f"Bearer {self.token_info.access_token}"
-        self.client.headers["Authorization"] = f"Bearer {self.token_info.access_token}"
+        # With client credentials the token is fetched on the first request,
+        # so the async path never blocks the event loop on a synchronous call
 
     @property
     def session(self) -> httpx.Client:
@@ -113,13 +303,30 @@ class LegifranceApiClient:
 
     @property
     def async_client(self) -> httpx.AsyncClient:
-        """Return the async httpx client, creating it if necessary."""
-        if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient(
-                headers=self._headers,
+        """Return the async httpx client."""
+        return self._async_client
+
+    @property
+    def token_client(self) -> httpx.Client:
+        """Return the httpx client for token requests, creating it if needed."""
+        if self._token_client is None or self._token_client.is_closed:
+            self._token_client = httpx.Client(
+                headers=TOKEN_HEADERS,
                 timeout=self.timeout,
+                limits=HTTP_LIMITS,
             )
-        return self._async_client
+        return self._token_client
+
+    @property
+    def token_async_client(self) -> httpx.AsyncClient:
+        """Return the async httpx client for token requests, creating it if needed."""
+        if self._token_async_client is None or self._token_async_client.is_closed:
+            self._token_async_client = httpx.AsyncClient(
+                headers=TOKEN_HEADERS,
+                timeout=self.timeout,
+                limits=HTTP_LIMITS,
+            )
+        return self._token_async_client
 
     def _get_token_payload(self) -> dict[str, str]:
         """Get the payload for token requests."""
@@ -143,10 +350,12 @@ class LegifranceApiClient:
         # Calculate token expiry with a 60-second safety margin
         expires_in = int(token_data.get("expires_in", 3600))
         expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+        expires_at_mono = time.monotonic() + (expires_in - 60)
 
         return TokenInfo(
             access_token=token_data["access_token"],
             expires_at=expires_at,
+            expires_at_mono=expires_at_mono,
         )
 
     def _handle_token_error(self, e: Exception) -> None:
@@ -192,12 +401,6 @@ class LegifranceApiClient:
                 original_exception=e,
             ) from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     def _get_access_token(self) -> TokenInfo:
         """
         Retrieves an access token using client credentials and updates the token expiry.
@@ -212,13 +415,9 @@ class LegifranceApiClient:
         payload = self._get_token_payload()
 
         try:
-            response = httpx.post(
-                self._token_url,
-                data=payload,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=self.timeout,
+            response = _send_with_retry(
+                partial(self.token_client.post, self._token_url, data=payload)
             )
-            response.raise_for_status()
             return self._process_token_response(response.json())
 
         except Exception as e:
@@ -226,12 +425,6 @@ class LegifranceApiClient:
             # This should never be reached
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     async def _get_access_token_async(self) -> TokenInfo:
         """
         Async version: Retrieves an access token using client credentials.
@@ -246,14 +439,10 @@ class LegifranceApiClient:
         payload = self._get_token_payload()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self._token_url,
-                    data=payload,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                response.raise_for_status()
-                return self._process_token_response(response.json())
+            response = await _send_with_retry_async(
+                partial(self.token_async_client.post, self._token_url, data=payload)
+            )
+            return self._process_token_response(response.json())
 
         except Exception as e:
             self._handle_token_error(e)
@@ -261,37 +450,121 @@ class LegifranceApiClient:
             raise
 
     def _is_token_expired(self) -> bool:
-        """Check if the current token is expired."""
-        return (
-            self.token_info.expires_at is not None
-            and datetime.now() > self.token_info.expires_at
+        """Check if the current token is missing or expired."""
+        return self.token_info is None or (
+            self.token_info.expires_at_mono is not None
+            and time.monotonic() > self.token_info.expires_at_mono
         )
 
     def _ensure_token(self) -> None:
         """Ensure the access token is valid and refresh it if expired."""
-        if self._is_token_expired():
-            logger.info("Access token expired, refreshing token...")
-            self.token_info = self._get_access_token()
-            self._update_auth_header()
+        if not self._is_token_expired():
+            return
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            if self._is_token_expired():
+                logger.info("Access token missing or expired, requesting token...")
+                self.token_info = self._get_access_token()
+                self._update_auth_header()
+
+    def _is_token_expiring(self) -> bool:
+        """Check if the current token expires within TOKEN_REFRESH_SKEW."""
+        return (
+            self.token_info is not None
+            and self.token_info.expires_at_mono is not None
+            and time.monotonic() > self.token_info.expires_at_mono - TOKEN_REFRESH_SKEW
+        )
 
     async def _ensure_token_async(self) -> None:
         """Async version: Ensure the access token is valid and refresh it if expired."""
-        if self._is_token_expired():
-            logger.info("Access token expired, refreshing token...")
-            self.token_info = await self._get_access_token_async()
-            self._update_auth_header()
+        if not self._is_token_expired():
+            # Still valid: refresh ahead of expiry without delaying this request
+            if self._is_token_expiring() and (
+                self._refresh_task is None or self._refresh_task.done()
+            ):
+                self._refresh_task = asyncio.create_task(
+                    self._refresh_token_in_background()
+                )
+            return
+
+        await self._refresh_token_async()
+
+    async def _refresh_token_async(self) -> None:
+        """Refresh the access token unless another coroutine already did."""
+        async with self._token_async_lock:
+            # Another coroutine may have refreshed the token while we waited
+            if self._is_token_expired() or self._is_token_expiring():
+                logger.info("Access token missing or expiring, requesting token...")
+                self.token_info = await self._get_access_token_async()
+                self._update_auth_header()
+
+    def _has_client_credentials(self) -> bool:
+        """Check whether the client can request tokens by itself."""
+        return bool(self._client_id and self._client_secret and self._token_url)
+
+    def _renew_token(self, rejected: str | None) -> bool:
+        """
+        Replace a token rejected by the server, unless another thread already did.
+
+        Args:
+            rejected: The Authorization header the server rejected
+
+        Returns:
+            bool: Whether the request should be sent again with the new token
+        """
+        if not self._has_client_credentials():
+            # A static token cannot be renewed
+            return False
+
+        with self._token_lock:
+            if self._auth.header == rejected:
+                logger.info("Access token rejected, requesting token...")
+                self.token_info = self._get_access_token()
+                self._update_auth_header()
+        return True
+
+    async def _renew_token_async(self, rejected: str | None) -> bool:
+        """
+        Async version: Replace a token rejected by the server.
+
+        Args:
+            rejected: The Authorization header the server rejected
+
+        Returns:
+            bool: Whether the request should be sent again with the new token
+        """
+        if not self._has_client_credentials():
+            # A static token cannot be renewed
+            return False
+
+        async with self._token_async_lock:
+            if self._auth.header == rejected:
+                logger.info("Access token rejected, requesting token...")
+                self.token_info = await self._get_access_token_async()
+                self._update_auth_header()
+        return True
+
+    async def _refresh_token_in_background(self) -> None:
+        """Refresh the access token, logging failures instead of raising them."""
+        try:
+            await self._refresh_token_async()
+        except APIError as e:
+            # The current token is still valid; the next request will retry
+            logger.warning(f"Background token refresh failed: {e}")
 
     def _update_auth_header(self) -> None:
-        """Update the authorization header in all clients."""
-        auth_header = f"Bearer {self.token_info.access_token}"
-        self._headers["Authorization"] = auth_header
-        self.client.headers["Authorization"] = auth_header
-        if self._async_client is not None and not self._async_client.is_closed:
-            self._async_client.headers["Authorization"] = auth_header
+        """Point the shared bearer authentication at the current token."""
+        self._auth.set_token(self.token_info.access_token)
 
     def _build_url(self, endpoint: str) -> str:
-        """Build the full URL for an endpoint."""
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Build the full URL for an endpoint, reusing previously built ones."""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            if len(self._url_cache) < URL_CACHE_SIZE:
+                self._url_cache[endpoint] = url
+        return url
 
     def _handle_request_error(self, e: Exception, method_name: str = "request") -> None:
         """
@@ -343,30 +616,27 @@ class LegifranceApiClient:
                 original_exception=e,
             ) from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     def request(
         self,
         method: str,
         endpoint: str,
         payload: Any = None,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        return_text_on_parse_error: bool = False,
+    ) -> dict[str, Any] | str:
         """
         Send an HTTP request and return the JSON response.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint to request
-            payload: Request payload (will be converted to JSON)
+            payload: Request payload (serialized to JSON with orjson)
             params: Query parameters
+            return_text_on_parse_error: Return the raw body instead of raising
+                when the response is not valid JSON
 
         Returns:
-            The JSON response as a dictionary
+            The JSON response as a dictionary, or the response text
 
         Raises:
             LegifranceError: For Legifrance-specific errors
@@ -374,48 +644,54 @@ class LegifranceApiClient:
             DataParsingError: If the response cannot be parsed as JSON
             APIError: For other API-related errors
         """
-        self._ensure_token()
         url = self._build_url(endpoint)
 
         try:
-            response = self.client.request(
-                method=method,
-                url=url,
-                json=payload,
-                params=params,
+            response = _send_with_retry(
+                partial(
+                    self.client.request,
+                    method=method,
+                    url=url,
+                    content=None if payload is None else orjson.dumps(payload),
+                    params=params,
+                )
             )
-            response.raise_for_status()
-            return response.json()
-
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                if return_text_on_parse_error:
+                    return response.text
+                raise
+
+        except APIError:
+            # Token errors raised from the authentication flow
+            raise
         except Exception as e:
             self._handle_request_error(e)
             # This should never be reached due to _handle_request_error always raising
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     async def request_async(
         self,
         method: str,
         endpoint: str,
         payload: Any = None,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        return_text_on_parse_error: bool = False,
+    ) -> dict[str, Any] | str:
         """
         Async version: Send an HTTP request and return the JSON response.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint to request
-            payload: Request payload (will be converted to JSON)
+            payload: Request payload (serialized to JSON with orjson)
             params: Query parameters
+            return_text_on_parse_error: Return the raw body instead of raising
+                when the response is not valid JSON
 
         Returns:
-            The JSON response as a dictionary
+            The JSON response as a dictionary, or the response text
 
         Raises:
             LegifranceError: For Legifrance-specific errors
@@ -423,19 +699,28 @@ class LegifranceApiClient:
             DataParsingError: If the response cannot be parsed as JSON
             APIError: For other API-related errors
         """
-        await self._ensure_token_async()
         url = self._build_url(endpoint)
 
         try:
-            response = await self.async_client.request(
-                method=method,
-                url=url,
-                json=payload,
-                params=params,
+            response = await _send_with_retry_async(
+                partial(
+                    self.async_client.request,
+                    method=method,
+                    url=url,
+                    content=None if payload is None else orjson.dumps(payload),
+                    params=params,
+                )
             )
-            response.raise_for_status()
-            return response.json()
-
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                if return_text_on_parse_error:
+                    return response.text
+                raise
+
+        except APIError:
+            # Token errors raised from the authentication flow
+            raise
         except Exception as e:
             self._handle_request_error(e, method_name="async request")
             # This should never be reached due to _handle_request_error always raising
@@ -461,16 +746,9 @@ class LegifranceApiClient:
             AuthenticationError: If authentication fails
             APIError: For other API-related errors
         """
-        try:
-            response = self.request("GET", endpoint, params=params)
-            return response
-        except DataParsingError:
-            # If JSON parsing failed in request(), try to get the text content
-            self._ensure_token()
-            url = self._build_url(endpoint)
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            return response.text
+        return self.request(
+            "GET", endpoint, params=params, return_text_on_parse_error=True
+        )
 
     async def get_async(
         self,
@@ -492,16 +770,9 @@ class LegifranceApiClient:
             AuthenticationError: If authentication fails
             APIError: For other API-related errors
         """
-        try:
-            response = await self.request_async("GET", endpoint, params=params)
-            return response
-        except DataParsingError:
-            # If JSON parsing failed in request_async(), try to get the text content
-            await self._ensure_token_async()
-            url = self._build_url(endpoint)
-            response = await self.async_client.get(url, params=params)
-            response.raise_for_status()
-            return response.text
+        return await self.request_async(
+            "GET", endpoint, params=params, return_text_on_parse_error=True
+        )
 
     def post(
         self,
@@ -549,18 +820,25 @@ class LegifranceApiClient:
         """
         return await self.request_async("POST", endpoint, payload=payload)
 
+    def close(self) -> None:
+        """Close the synchronous clients."""
+        self.client.close()
+        if self._token_client is not None:
+            self._token_client.close()
+
     async def aclose(self) -> None:
-        """Close the async client."""
-        if self._async_client is not None and not self._async_client.is_closed:
-            await self._async_client.aclose()
+        """Close the async clients; they are not recreated afterwards."""
+        for client in (self._async_client, self._token_async_client):
+            if client is not None and not client.is_closed:
+                await client.aclose()
 
     def __enter__(self) -> "LegifranceApiClient":
         """Support for context manager protocol."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close the client when exiting the context manager."""
-        self.client.close()
+        """Close the clients when exiting the context manager."""
+        self.close()
 
     async def __aenter__(self) -> "LegifranceApiClient":
         """Support for async context manager protocol."""
@@ -571,33 +849,68 @@ class LegifranceApiClient:
         await self.aclose()
 
 
-_api_client = None
-
-
+@lru_cache(maxsize=1)
 def get_api_client() -> LegifranceApiClient:
     """
     Returns a singleton instance of the LegifranceApiClient.
 
-    The client is initialized with settings from the configuration.
+    The client is initialized with settings from the configuration. Call
+    get_api_client.cache_clear() to drop it, e.g. in tests.
 
     Returns:
         LegifranceApiClient: The API client instance
     """
-    global _api_client
-    if _api_client is None:
-        _api_client = LegifranceApiClient(
-            base_url=settings.legifrance.api_url,
-            client_id=settings.legifrance.client_id,
-            client_secret=settings.legifrance.client_secret,
-            token_url=settings.legifrance.token_url,
-        )
-    return _api_client
+    client = LegifranceApiClient(
+        base_url=settings.legifrance.api_url,
+        client_id=settings.legifrance.client_id,
+        client_secret=settings.legifrance.client_secret,
+        token_url=settings.legifrance.token_url,
+    )
+    atexit.register(_close_api_client, client)
+    return client
+
+
+def _close_api_client(client: LegifranceApiClient) -> None:
+    """Close the connection pools of an API client at interpreter shutdown."""
+    client.close()
+    # The server's event loop is gone by now, so close on a fresh one; pools
+    # bound to the old loop may refuse, in which case the OS reclaims them
+    with suppress(RuntimeError):
+        asyncio.run(client.aclose())
+
+
+# (endpoint, canonical arguments) -> (expiry time, response), in LRU order
+_response_cache: OrderedDict[tuple[str, bytes], tuple[float, Any]] = OrderedDict()
+
+# (endpoint, canonical arguments) -> request in flight, shared by identical calls
+_pending_requests: dict[tuple[str, bytes], asyncio.Task] = {}
+
+
+async def _fetch_response(
+    endpoint: str, arguments: dict[str, Any], key: tuple[str, bytes]
+) -> Any:
+    """Send a request to the Legifrance API and cache a successful response."""
+    client = get_api_client()
+    try:
+        result = await client.post_async(f"/consult/{endpoint}", payload=arguments)
+    except APIError as e:
+        logger.error(f"API request failed: {e}")
+        return {"error": str(e)}
+
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, result)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return result
 
 
 async def make_api_request(endpoint: str, arguments: dict[str, Any]) -> Any:
     """
     Make an asynchronous request to the Legifrance API.
 
+    Successful responses are cached for RESPONSE_CACHE_TTL seconds, keyed on the
+    endpoint and the arguments; errors are never cached. Identical calls made
+    while a request is in flight wait for it instead of sending their own.
+
     Args:
         endpoint: The API endpoint to request (e.g., "code", "juri")
         arguments: The arguments to pass to the API
@@ -608,9 +921,19 @@ async def make_api_request(endpoint: str, arguments: dict[str, Any]) -> Any:
     Raises:
         APIError: If the API request fails
     """
-    client = get_api_client()
-    try:
-        return await client.post_async(f"/consult/{endpoint}", payload=arguments)
-    except APIError as e:
-        logger.error(f"API request failed: {e}")
-        return {"error": str(e)}
+    key = (endpoint, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    now = time.monotonic()
+    cached = _response_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _response_cache.move_to_end(key)
+            return cached[1]
+        del _response_cache[key]
+
+    task = _pending_requests.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_response(endpoint, arguments, key))
+        _pending_requests[key] = task
+        task.add_done_callback(lambda _: _pending_requests.pop(key, None))
+    # Shielded so that a cancelled caller does not cancel the shared request
+    return await asyncio.shield(task)
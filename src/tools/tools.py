@@ -1,13 +1,22 @@
-import json
+import logging
 from collections.abc import Sequence
+from functools import partial
 from typing import Any
 
+import orjson
 from mcp.types import TextContent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 from src.config.logging import logger
 from src.config.server import app
 from src.services.api_client import make_api_request
+from src.utils.utils import clean_dict
+
+# Builds response contents without re-validating the constant type field
+_text_content = partial(TextContent.model_construct, type="text")
+
+# Largest page the Legifrance API returns
+MAX_PAGE_SIZE = 100
 
 
 class TextContentModel(BaseModel):
@@ -20,7 +29,7 @@ class TextContentModel(BaseModel):
 class ApiRequestArgs(BaseModel):
     """Base model for API request arguments."""
 
-    pass
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class RechercherCodeArgs(ApiRequestArgs):
@@ -31,7 +40,7 @@ class RechercherCodeArgs(ApiRequestArgs):
     champ: str = "ALL"
     sort: str = "PERTINENCE"
     type_recherche: str = "TOUS_LES_MOTS_DANS_UN_CHAMP"
-    page_size: int = Field(default=10, le=100)
+    page_size: int = 10
     fetch_all: bool = False
 
 
@@ -43,7 +52,7 @@ class RechercherJurisprudenceJudiciaireArgs(ApiRequestArgs):
     sort: str = "PERTINENCE"
     champ: str = "ALL"
     type_recherche: str = "TOUS_LES_MOTS_DANS_UN_CHAMP"
-    page_size: int = Field(default=10, le=100)
+    page_size: int = 10
     fetch_all: bool = False
     juri_keys: list[str] | None = None
     juridiction_judiciaire: list[str] | None = None
@@ -56,32 +65,35 @@ class RechercherTexteLegelArgs(ApiRequestArgs):
     text_id: str | None = None
     champ: str = "ALL"
     type_recherche: str = "TOUS_LES_MOTS_DANS_UN_CHAMP"
-    page_size: int = Field(default=10, le=100)
+    page_size: int = 10
 
 
 async def execute_api_request(
-    endpoint: str, arguments: ApiRequestArgs
+    endpoint: str, arguments: dict[str, Any]
 ) -> Sequence[TextContent]:
     """
     Execute an API request and format the response.
 
     Args:
         endpoint: The API endpoint to request
-        arguments: The arguments to pass to the API
+        arguments: The arguments to pass to the API, without None values
 
     Returns:
         Sequence[TextContent]: Formatted API response
     """
     try:
-        # Convert Pydantic model to dict, excluding None values
-        args_dict = arguments.model_dump(exclude_none=True)
-        logger.info(f"Calling {endpoint} API with arguments: {json.dumps(args_dict)}")
-        result = await make_api_request(endpoint, args_dict)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling %s API with arguments: %s",
+                endpoint,
+                orjson.dumps(arguments).decode(),
+            )
+        result = await make_api_request(endpoint, arguments)
         return format_api_result(result)
     except Exception as e:
         error_message = f"Error executing {endpoint} API request: {e!s}"
         logger.error(error_message)
-        return [TextContent(type="text", text=error_message)]
+        return [_text_content(text=error_message)]
 
 
 def format_api_result(result: Any) -> Sequence[TextContent]:
@@ -94,24 +106,22 @@ def format_api_result(result: Any) -> Sequence[TextContent]:
     Returns:
         Sequence[TextContent]: Formatted result
     """
-    # Handle error responses
+    # Handle error responses; the error may come from the remote API, so it is
+    # not necessarily a string
     if isinstance(result, dict) and "error" in result:
-        return [TextContent(type="text", text=result["error"])]
+        return [_text_content(text=str(result["error"]))]
 
     # Format the result
     if isinstance(result, str):
-        return [TextContent(type="text", text=result)]
+        return [_text_content(text=result)]
     else:
-        return [
-            TextContent(
-                type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-            )
-        ]
+        text = orjson.dumps(
+            result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        return [_text_content(text=text)]
 
 
-@app.tool(
-    name="rechercher_code",
-    description="""
+_DESC_CODE = """
     Recherche des articles juridiques dans les codes de loi français.
 
     Paramètres:
@@ -126,8 +136,10 @@ def format_api_result(result: Any) -> Sequence[TextContent]:
     Exemples:
         - Pour le PACS dans le Code civil:
           {search="pacte civil de solidarité", code_name="Code civil"}
-    """,
-)
+    """
+
+
+@app.tool(name="rechercher_code", description=_DESC_CODE)
 async def rechercher_code(
     search: str,
     code_name: str,
@@ -152,23 +164,21 @@ async def rechercher_code(
     Returns:
         Sequence[TextContent]: Résultat de la recherche
     """
-    # Create a validated model instance
-    arguments = RechercherCodeArgs(
-        search=search,
-        code_name=code_name,
-        champ=champ,
-        sort=sort,
-        type_recherche=type_recherche,
-        page_size=page_size,
-        fetch_all=fetch_all,
-    )
+    # FastMCP already validated the parameters against the signature
+    arguments = {
+        "search": search,
+        "code_name": code_name,
+        "champ": champ,
+        "sort": sort,
+        "type_recherche": type_recherche,
+        "page_size": min(page_size, MAX_PAGE_SIZE),
+        "fetch_all": fetch_all,
+    }
 
     return await execute_api_request("code", arguments)
 
 
-@app.tool(
-    name="rechercher_jurisprudence_judiciaire",
-    description="""
+_DESC_JURI = """
     Recherche des jurisprudences judiciaires dans la base JURI de Legifrance.
 
     Paramètres:
@@ -193,8 +203,10 @@ async def rechercher_code(
             search = "signature électronique", fetch_all=True,
             juri_keys=['titre', 'sommaire']
 
-    """,
-)
+    """
+
+
+@app.tool(name="rechercher_jurisprudence_judiciaire", description=_DESC_JURI)
 async def rechercher_jurisprudence_judiciaire(
     search: str,
     publication_bulletin: list[str] | None = None,
@@ -223,26 +235,26 @@ async def rechercher_jurisprudence_judiciaire(
     Returns:
         Sequence[TextContent]: Résultat de la recherche
     """
-    # Create a validated model instance
-    arguments = RechercherJurisprudenceJudiciaireArgs(
-        search=search,
-        publication_bulletin=publication_bulletin,
-        sort=sort,
-        champ=champ,
-        type_recherche=type_recherche,
-        page_size=page_size,
-        fetch_all=fetch_all,
-        juri_keys=juri_keys,
-        juridiction_judiciaire=juridiction_judiciaire,
+    # FastMCP already validated the parameters against the signature
+    arguments = clean_dict(
+        {
+            "search": search,
+            "publication_bulletin": publication_bulletin,
+            "sort": sort,
+            "champ": champ,
+            "type_recherche": type_recherche,
+            "page_size": min(page_size, MAX_PAGE_SIZE),
+            "fetch_all": fetch_all,
+            "juri_keys": juri_keys,
+            "juridiction_judiciaire": juridiction_judiciaire,
+        }
     )
 
     # Use the common execute_api_request function for consistency
     return await execute_api_request("juri", arguments)
 
 
-@app.tool(
-    name="rechercher_dans_texte_legal",
-    description="""
+_DESC_TEXTE = """
     Recherche un article dans un texte légal (loi, ordonnance, décret, arrêté)
     par le numéro du texte et le numéro de l'article. On peut également rechercher
     des mots clés ("mots clés" séparés par des espaces) dans une loi précise (n° de loi)
@@ -260,8 +272,10 @@ async def rechercher_jurisprudence_judiciaire(
           {text_id="78-17", search="7", champ="NUM_ARTICLE"}
         - On cherche les conditions de validité de la signature électronique :
           {search="signature électronique validité conditions"}
-    """,
-)
+    """
+
+
+@app.tool(name="rechercher_dans_texte_legal", description=_DESC_TEXTE)
 async def rechercher_dans_texte_legal(
     search: str,
     text_id: str | None = None,
@@ -282,13 +296,15 @@ async def rechercher_dans_texte_legal(
     Returns:
         Sequence[TextContent]: Résultat de la recherche
     """
-    # Create a validated model instance
-    arguments = RechercherTexteLegelArgs(
-        search=search,
-        text_id=text_id,
-        champ=champ,
-        type_recherche=type_recherche,
-        page_size=page_size,
+    # FastMCP already validated the parameters against the signature
+    arguments = clean_dict(
+        {
+            "search": search,
+            "text_id": text_id,
+            "champ": champ,
+            "type_recherche": type_recherche,
+            "page_size": min(page_size, MAX_PAGE_SIZE),
+        }
     )
 
     return await execute_api_request("texte_legal", arguments)
@@ -3,21 +3,33 @@ Utility functions for the MCP server.
 """
 
 import asyncio
+import hashlib
+import os
+import time
+from collections import deque
 from collections.abc import Callable
-from datetime import datetime
-from functools import wraps
+from contextlib import suppress
+from functools import cache, wraps
 from pathlib import Path
 from typing import Any, TypeVar
 
+import orjson
 import yaml
 
 T = TypeVar("T")
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def clean_dict(d: dict) -> dict:
     """
     Supprime les clés dont la valeur est None pour optimiser les requêtes API.
 
+    Le dictionnaire d'origine est renvoyé tel quel s'il ne contient aucune
+    valeur None, ce qui évite une copie inutile. Sinon, il est copié puis les
+    quelques clés à None sont supprimées de la copie.
+
     Args:
         d (dict): Dictionnaire à nettoyer
 
@@ -28,7 +40,13 @@ def clean_dict(d: dict) -> dict:
         >>> clean_dict({"a": 1, "b": None, "c": "test"})
         {'a': 1, 'c': 'test'}
     """
-    return {k: v for k, v in d.items() if v is not None}
+    if None not in d.values():
+        return d
+    cleaned = d.copy()
+    for k, v in d.items():
+        if v is None:
+            del cleaned[k]
+    return cleaned
 
 
 def rate_limit(calls: int, period: float):
@@ -50,8 +68,13 @@ def rate_limit(calls: int, period: float):
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        last_reset = datetime.now()
-        calls_made = 0
+        # Instants des derniers appels, dans une fenêtre glissante
+        times: deque[float] = deque(maxlen=calls)
+
+        def expire(now: float) -> None:
+            """Oublie les appels sortis de la fenêtre."""
+            while times and now - times[0] > period:
+                times.popleft()
 
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
@@ -59,22 +82,20 @@ def rate_limit(calls: int, period: float):
             Wrapper qui limite le taux d'appels à la fonction décorée.
             Attend si nécessaire pour respecter la limite définie.
             """
-            nonlocal last_reset, calls_made
-            now = datetime.now()
-
-            elapsed_time = (now - last_reset).total_seconds()
-            if elapsed_time > period:
-                calls_made = 0
-                last_reset = now
-
-            if calls_made >= calls:
-                wait_time = period - (now - last_reset).total_seconds()
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                    last_reset = datetime.now()
-                    calls_made = 0
-
-            calls_made += 1
+            now = time.monotonic()
+            expire(now)
+
+            # Pas de verrou, qui serait lié à une seule boucle d'événements :
+            # la revérification après chaque attente suffit à tenir la limite
+            while len(times) >= calls:
+                # Attend que l'appel le plus ancien sorte de la fenêtre
+                await asyncio.sleep(period - (now - times[0]))
+                now = time.monotonic()
+                expire(now)
+
+            # Aucun await depuis la vérification : l'ajout est atomique
+            times.append(now)
+
             return await func(*args, **kwargs)
 
         return wrapper
@@ -82,10 +103,50 @@ def rate_limit(calls: int, period: float):
     return decorator
 
 
+def _cache_dir() -> Path | None:
+    """
+    Return the directory holding the parsed YAML cache.
+
+    Returns None when no home directory can be determined (e.g. containers
+    running under an arbitrary UID), in which case nothing is cached.
+    """
+    try:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except (RuntimeError, OSError):
+        return None
+    return Path(base) / "mcp-legifrance"
+
+
+def _yaml_cache_prefix(path: Path) -> str:
+    """
+    Return the prefix shared by the JSON cache files of a YAML file.
+
+    It includes a digest of the resolved path, so that files with the same
+    name in different directories (e.g. two checkouts) keep separate entries.
+    """
+    digest = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+    return f"{path.stem}.{digest}"
+
+
+def _yaml_cache_path(cache_dir: Path, path: Path, raw: bytes) -> Path:
+    """
+    Return the JSON cache file for a parsed YAML file.
+
+    The key is a digest of the file content, so any edit of the source file
+    invalidates the cache, even one that preserves its size and mtime.
+    """
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return cache_dir / f"{_yaml_cache_prefix(path)}.{digest}.json"
+
+
 def load_prompt_templates(template_path: str | Path | None = None) -> dict:
     """
     Load prompt templates from a YAML file.
 
+    The parsed templates are cached on disk as JSON so that subsequent starts
+    skip YAML parsing as long as the source file is unchanged, and in memory
+    so that each file is loaded at most once per process.
+
     Args:
         template_path (str | Path, optional): Path to the YAML template file.
             If None, uses the default path in the prompts directory.
@@ -98,5 +159,50 @@ def load_prompt_templates(template_path: str | Path | None = None) -> dict:
             Path(__file__).parent.parent / "prompts" / "prompt_templates.yml"
         )
 
-    with open(template_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_prompt_templates(str(Path(template_path).resolve()))
+
+
+@cache
+def _load_prompt_templates(resolved_path: str) -> dict:
+    """Load the prompt templates of a resolved path, through the JSON cache."""
+    path = Path(resolved_path)
+    raw = path.read_bytes()
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return yaml.load(raw, Loader=YAML_LOADER)
+
+    cache_path = _yaml_cache_path(cache_dir, path, raw)
+    try:
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    templates = yaml.load(raw, Loader=YAML_LOADER)
+
+    # Only cache templates that JSON gives back unchanged, so that cached and
+    # uncached loads agree (YAML also has dates, non-string keys, ...)
+    try:
+        encoded = orjson.dumps(templates)
+    except orjson.JSONEncodeError:
+        return templates
+    if orjson.loads(encoded) != templates:
+        return templates
+
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(encoded)
+        os.replace(tmp_path, cache_path)
+        # Drop the entries of previous versions of the file, which would
+        # otherwise pile up with every edit
+        pattern = f"{_yaml_cache_prefix(path)}.{'[0-9a-f]' * 32}.json"
+        for stale in cache_dir.glob(pattern):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # The cache is an optimisation only; a read-only home is fine
+        with suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+    return templates
@@ -1,27 +1,67 @@
+import contextlib
 import os
+import signal
+import socket
 import subprocess
+import tempfile
 import time
+from typing import IO
 
-import pytest_asyncio
+import pytest
 
 os.environ["DEV_API_KEY"] = "mock_api_key"
 os.environ["DEV_API_URL"] = "mock_api_url"
 
+SERVER_HOST = "localhost"
+SERVER_PORT = 8000
+SERVER_STARTUP_TIMEOUT = 10.0
 
-@pytest_asyncio.fixture
-async def server():
+
+def wait_for_server(process: subprocess.Popen, stderr: IO[bytes]) -> None:
+    """
+    Wait until the server accepts connections on its port.
+    """
+    deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+    while True:
+        if process.poll() is not None:
+            stderr.seek(0)
+            raise RuntimeError(
+                f"Server exited with code {process.returncode}: "
+                f"{stderr.read().decode(errors='replace')}"
+            )
+        try:
+            socket.create_connection((SERVER_HOST, SERVER_PORT), timeout=0.05).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Server not listening on port {SERVER_PORT} after "
+                    f"{SERVER_STARTUP_TIMEOUT} seconds"
+                ) from None
+            time.sleep(0.01)
+
+
+@pytest.fixture(scope="session")
+def server():
     """
-    Starts the application server for each test function.
+    Starts the application server once for the whole test session.
     """
-    process = subprocess.Popen(
-        ["uv", "run", "python", "-m", "src.app"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    time.sleep(1)
-    try:
-        yield
-    finally:
-        process.kill()
-        process.wait()
+    # Output goes to files rather than pipes, which nobody drains and which
+    # would block a long-running server once full
+    with tempfile.TemporaryFile() as stderr:
+        # In its own process group so that the server spawned by uv is killed too
+        process = subprocess.Popen(
+            ["uv", "run", "python", "-m", "src.app"],
+            stdout=subprocess.DEVNULL,
+            stderr=stderr,
+            start_new_session=True,
+        )
+
+        try:
+            wait_for_server(process, stderr)
+            yield
+        finally:
+            # The group is already gone if the server exited during startup
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
@@ -1,11 +1,15 @@
-def test_ping_endpoint(api_client):
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_ping_endpoint(api_client):
     """
     Integration test for the ping endpoint.
 
     It verifies that the /consult/ping endpoint returns 'pong'.
     """
-    api_client.session.headers.update({"Accept": "text/plain"})
+    api_client.async_client.headers.update({"Accept": "text/plain"})
 
-    response = api_client.get("/consult/ping")
+    response = await api_client.get_async("/consult/ping")
 
     assert response == "pong", f"Unexpected response: {response}"
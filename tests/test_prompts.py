@@ -0,0 +1,38 @@
+import pytest
+
+from src.prompts.prompts import get_prompt, render_template
+from src.utils.utils import load_prompt_templates
+
+
+def user_text(prompt: dict) -> str:
+    """Return the text of the user message of a rendered prompt."""
+    message = next(m for m in prompt["messages"] if m["role"] == "user")
+    return message["content"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_does_not_modify_template():
+    """Test that each call renders its own question into a fresh copy."""
+    first = await get_prompt("agent_juridique_expert", {"question": "Première ?"})
+    second = await get_prompt("agent_juridique_expert", {"question": "Seconde ?"})
+
+    assert user_text(first).endswith("Première ?")
+    assert user_text(second).endswith("Seconde ?")
+    assert "{question}" in user_text(load_prompt_templates()["agent_juridique_expert"])
+
+
+def test_render_template_keeps_unknown_placeholders():
+    """Test that only known variables are replaced."""
+    text = "Question : {question} ({inconnue})"
+
+    assert render_template(text, {"question": "Q"}) == "Question : Q ({inconnue})"
+
+
+def test_render_template_keeps_literal_braces():
+    """Test that braces which are not placeholders are left untouched."""
+    text = 'Réponds en JSON {"source": "..."} à {question} {} {1}'
+
+    assert (
+        render_template(text, {"question": "Q", "1": "x"})
+        == 'Réponds en JSON {"source": "..."} à Q {} {1}'
+    )
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from src.services import api_client
+from src.services.api_client import LegifranceApiClient
+
+
+class FakeOAuthServer:
+    """Token endpoint and API accepting only the tokens issued so far."""
+
+    def __init__(self) -> None:
+        self.token_requests = 0
+        self.api_requests = 0
+        self.valid_tokens: set[str] = set()
+
+    async def token_handler(self, request: httpx.Request) -> httpx.Response:
+        self.token_requests += 1
+        # Leaves time for concurrent requests to pile up on the token lock
+        await asyncio.sleep(0.01)
+        token = f"token-{self.token_requests}"
+        self.valid_tokens.add(token)
+        return httpx.Response(200, json={"access_token": token, "expires_in": 3600})
+
+    async def api_handler(self, request: httpx.Request) -> httpx.Response:
+        self.api_requests += 1
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if token not in self.valid_tokens:
+            return httpx.Response(401)
+        return httpx.Response(200, json={"token": token})
+
+
+@pytest.fixture
+def oauth_server():
+    return FakeOAuthServer()
+
+
+@pytest.fixture
+def client(oauth_server):
+    client = LegifranceApiClient(
+        base_url="https://api.test",
+        client_id="client_id",
+        client_secret="client_secret",
+        token_url="https://oauth.test/token",
+    )
+    client._async_client = httpx.AsyncClient(
+        auth=client._auth, transport=httpx.MockTransport(oauth_server.api_handler)
+    )
+    client._token_async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(oauth_server.token_handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_renewed_once(client, oauth_server):
+    """Test that a token rejected with a 401 is renewed and the request resent."""
+    assert await client.post_async("/consult/code") == {"token": "token-1"}
+
+    # The server revokes the token before it expires
+    oauth_server.valid_tokens.clear()
+
+    assert await client.post_async("/consult/code") == {"token": "token-2"}
+    assert oauth_server.token_requests == 2
+    # Initial request, rejected request, resent request
+    assert oauth_server.api_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rejections_share_one_renewal(client, oauth_server):
+    """Test that concurrent 401s trigger a single token request."""
+    await client.post_async("/consult/code")
+    oauth_server.valid_tokens.clear()
+
+    results = await asyncio.gather(
+        *(client.post_async("/consult/code", {"page": i}) for i in range(5))
+    )
+
+    assert results == [{"token": "token-2"}] * 5
+    assert oauth_server.token_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_expiring_token_is_refreshed_in_background(client, oauth_server):
+    """Test that a token about to expire is used once more while it is refreshed."""
+    oauth_server.valid_tokens.add("expiring")
+    client.token_info = api_client.TokenInfo(
+        access_token="expiring",
+        expires_at_mono=time.monotonic() + api_client.TOKEN_REFRESH_SKEW / 2,
+    )
+    client._update_auth_header()
+
+    assert await client.post_async("/consult/code") == {"token": "expiring"}
+
+    await client._refresh_task
+    assert oauth_server.token_requests == 1
+    assert await client.post_async("/consult/code") == {"token": "token-1"}
+
+
+@pytest.mark.asyncio
+async def test_static_token_is_not_renewed(oauth_server):
+    """Test that a 401 on a static token is raised instead of renewed."""
+    client = LegifranceApiClient(base_url="https://api.test", token="static")
+    client._async_client = httpx.AsyncClient(
+        auth=client._auth, transport=httpx.MockTransport(oauth_server.api_handler)
+    )
+
+    with pytest.raises(api_client.AuthenticationError):
+        await client.post_async("/consult/code")
+    assert oauth_server.token_requests == 0
+
+
+@pytest.fixture
+def api_requests(monkeypatch):
+    """Route make_api_request to a mock API and return the payloads it received."""
+    payloads = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(request.content)
+        call = len(payloads)
+        # Keeps the request in flight long enough for callers to overlap
+        await asyncio.sleep(0.01)
+        if b"missing" in request.content:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"call": call})
+
+    client = LegifranceApiClient(base_url="https://api.test", token="static")
+    client._async_client = httpx.AsyncClient(
+        auth=client._auth, transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(api_client, "get_api_client", lambda: client)
+    monkeypatch.setattr(api_client, "_response_cache", OrderedDict())
+    monkeypatch.setattr(api_client, "_pending_requests", {})
+    return payloads
+
+
+@pytest.mark.asyncio
+async def test_successful_responses_are_cached(api_requests):
+    """Test that an identical request is served from the cache."""
+    first = await api_client.make_api_request("code", {"a": 1, "b": 2})
+    second = await api_client.make_api_request("code", {"b": 2, "a": 1})
+
+    assert first == second == {"call": 1}
+    assert len(api_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(api_requests):
+    """Test that a failed request is sent again on the next call."""
+    first = await api_client.make_api_request("code", {"id": "missing"})
+    second = await api_client.make_api_request("code", {"id": "missing"})
+
+    assert "error" in first
+    assert "error" in second
+    assert len(api_requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced(api_requests):
+    """Test that identical calls in flight share a single POST."""
+    results = await asyncio.gather(
+        *(api_client.make_api_request("code", {"a": 1}) for _ in range(5)),
+        api_client.make_api_request("code", {"a": 2}),
+    )
+
+    assert results[:5] == [results[0]] * 5
+    assert results[5] != results[0]
+    assert len(api_requests) == 2
+    assert api_client._pending_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request(api_requests):
+    """Test that cancelling one waiter leaves the shared request running."""
+    cancelled = asyncio.create_task(api_client.make_api_request("juri", {"a": 1}))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(api_client.make_api_request("juri", {"a": 1}))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    assert await waiter == {"call": 1}
+    assert cancelled.cancelled()
+    assert len(api_requests) == 1
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    """Retry failed requests immediately."""
+    monkeypatch.setattr(api_client, "_retry_delay", lambda attempt: 0)
+
+
+def static_client(handler) -> LegifranceApiClient:
+    """Build a client with a static token sending its requests to `handler`."""
+    client = LegifranceApiClient(base_url="https://api.test", token="static")
+    client._async_client = httpx.AsyncClient(
+        auth=client._auth, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("status_code", "attempts"), [(404, 1), (503, 3)])
+async def test_retry_policy(no_retry_delay, status_code, attempts):
+    """Test that only server errors are retried, up to MAX_ATTEMPTS times."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code)
+
+    with pytest.raises(api_client.LegifranceError):
+        await static_client(handler).post_async("/consult/code")
+    assert len(requests) == attempts
+
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried(no_retry_delay):
+    """Test that a request succeeding after a server error returns its response."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    assert await static_client(handler).post_async("/consult/code") == {"ok": True}
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_returns_text_on_parse_error():
+    """Test that GET falls back to the raw body while POST reports a parse error."""
+    requests = []
+
+    def plain_text(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text="pong")
+
+    client = static_client(plain_text)
+    client.client = httpx.Client(
+        auth=client._auth, transport=httpx.MockTransport(plain_text)
+    )
+
+    assert client.get("/consult/ping") == "pong"
+    assert await client.get_async("/consult/ping") == "pong"
+    # The body is reused rather than requested a second time
+    assert len(requests) == 2
+
+    with pytest.raises(api_client.DataParsingError):
+        await client.post_async("/consult/code")
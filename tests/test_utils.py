@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils import utils
+from src.utils.utils import rate_limit
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_sliding_window():
+    """Test that no window of `period` seconds contains more than `calls` calls."""
+    calls, period = 3, 0.1
+    times = []
+
+    @rate_limit(calls=calls, period=period)
+    async def api_call():
+        times.append(time.monotonic())
+
+    await asyncio.gather(*(api_call() for _ in range(10)))
+
+    assert len(times) == 10
+    # Scheduling jitter between the limiter and the call is well below this
+    tolerance = 1e-3
+    for first, last in zip(times, times[calls:], strict=False):
+        assert last - first >= period - tolerance
+
+
+def test_rate_limit_across_event_loops():
+    """Test that a decorated function can be throttled under successive loops."""
+    times = []
+
+    @rate_limit(calls=1, period=0.05)
+    async def api_call():
+        times.append(time.monotonic())
+
+    async def burst():
+        await asyncio.gather(*(api_call() for _ in range(3)))
+
+    # Each run has its own loop, as with pytest-asyncio's function-scoped loops
+    asyncio.run(burst())
+    asyncio.run(burst())
+
+    assert len(times) == 6
+
+
+def test_yaml_cache_entries(tmp_path, monkeypatch):
+    """Test that edits prune older entries without touching same-named files."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    first = tmp_path / "a" / "prompt_templates.yml"
+    second = tmp_path / "b" / "prompt_templates.yml"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_text("prompt: 1\n")
+        assert utils.load_prompt_templates(path) == {"prompt": 1}
+
+    first.write_text("prompt: 2\n")
+    utils._load_prompt_templates.cache_clear()
+    assert utils.load_prompt_templates(first) == {"prompt": 2}
+
+    cache_dir = tmp_path / "cache" / "mcp-legifrance"
+    assert {entry.name for entry in cache_dir.iterdir()} == {
+        utils._yaml_cache_path(cache_dir, path.resolve(), path.read_bytes()).name
+        for path in (first, second)
+    }